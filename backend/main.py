@@ -1,22 +1,56 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import os
+import math
+import time
+import functools
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 from dotenv import load_dotenv
 from nixtla import NixtlaClient
 import httpx
-import requests
+import anyio
 import logging
+from contextlib import asynccontextmanager
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional; without it the kernels run as plain Python/NumPy
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 # Load environment variables
 load_dotenv()
 
+# Shared HTTP client so outbound requests reuse pooled connections
+http_client = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=10))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if NUMBA_AVAILABLE:
+        # Run on the loop thread: the parallel kernels are called from here at request time
+        warm_up_kernels()
+    yield
+    await http_client.aclose()
+
 # Initialize FastAPI app
-app = FastAPI(title="TimeGPT Forecast API", version="1.0.0")
+app = FastAPI(
+    title="TimeGPT Forecast API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # Configure CORS
 app.add_middleware(
@@ -52,7 +86,10 @@ class ForecastRequest(BaseModel):
     horizon: int = 288  # 24 hours in 5-minute intervals
     interval_minutes: int = 5
     confidence_levels: List[int] = [80, 95]
+    seed: Optional[int] = None  # Makes the synthetic fallback reproducible
 
+# Response schema for the forecast endpoint. The endpoint returns an ORJSONResponse
+# with this shape directly, so it is used for the OpenAPI docs rather than validation.
 class ForecastResponse(BaseModel):
     forecasts: List[Dict[str, Any]]
     analysis: str
@@ -66,24 +103,70 @@ class ForecastResponse(BaseModel):
 async def root():
     return {"message": "TimeGPT Forecast API is running!"}
 
+PRICE_COLUMNS = ['energy_price', 'hash_price', 'token_price']
+
+# Shared generator for synthetic noise; requests with a seed get their own
+_rng = np.random.default_rng()
+
+# Path to the CSV file
+MARKET_DATA_CSV_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'app', 'data', 'multi_market_data.csv')
+
+# Parsed CSV data is reused across requests; the file only changes between deploys
+MARKET_DATA_CACHE_TTL_SECONDS = 60
+_market_data_cache = {}
+
+# TimeGPT results are reused for identical requests within the same interval
+FORECAST_CACHE_TTL_SECONDS = 300
+_forecast_cache = {}
+
+def _ttl_cache_get(cache, key, ttl):
+    """Return the cached value for key if it is younger than ttl seconds, else None"""
+    entry = cache.get(key)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+def _ttl_cache_put(cache, key, value, ttl):
+    """Store value under key, dropping expired entries so the cache stays bounded"""
+    now = time.monotonic()
+    for stale_key in [k for k, (ts, _) in cache.items() if now - ts >= ttl]:
+        del cache[stale_key]
+    cache[key] = (now, value)
+
+@functools.lru_cache(maxsize=2)
+def _load_csv_cached(csv_path, mtime):
+    """Read and sort the market data CSV (cached per file modification time)"""
+    # Read the CSV file, parsing timestamps inline with explicit price dtypes
+    df = pd.read_csv(
+        csv_path,
+        usecols=['timestamp'] + PRICE_COLUMNS,
+        parse_dates=['timestamp'],
+        dtype={col: 'float64' for col in PRICE_COLUMNS}
+    )
+    
+    # Sort by timestamp (ascending - oldest first)
+    return df.sort_values('timestamp')
+
 def generate_energy_market_data(days=7, interval_minutes=5):
-    """Read energy market data from CSV file"""
-    import os
+    """Read energy market data from CSV file
     
-    # Path to the CSV file
-    csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'app', 'data', 'multi_market_data.csv')
+    Returns a dict of parallel NumPy arrays keyed by 'timestamp' (datetime64)
+    and each price column. The arrays may be shared with the cache, so callers
+    must not modify them in place.
+    """
+    csv_path = MARKET_DATA_CSV_PATH
     
     print(f"📊 Reading data from {csv_path}...")
     
     try:
-        # Read the CSV file
-        df = pd.read_csv(csv_path)
+        mtime = os.path.getmtime(csv_path)
+        cache_key = (mtime, days, interval_minutes)
+        cached = _ttl_cache_get(_market_data_cache, cache_key, MARKET_DATA_CACHE_TTL_SECONDS)
+        if cached:
+            print(f"✅ Using {len(cached['timestamp'])} cached data points from CSV")
+            return dict(cached)
         
-        # Convert timestamp to datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        
-        # Sort by timestamp (ascending - oldest first)
-        df = df.sort_values('timestamp')
+        df = _load_csv_cached(csv_path, mtime)
         
         # Calculate the date range for the requested days
         end_date = datetime.now()
@@ -91,19 +174,14 @@ def generate_energy_market_data(days=7, interval_minutes=5):
         
         # Filter data for the requested time period
         df = df[(df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)]
-        
-        # Create list of data points
-        data_points = []
-        for _, row in df.iterrows():
-            data_points.append({
-                'timestamp': pd.to_datetime(row['timestamp']).strftime('%Y-%m-%dT%H:%M:%S'),
-                'energy_price': float(row['energy_price']),
-                'hash_price': float(row['hash_price']),
-                'token_price': float(row['token_price'])
-            })
-        
-        print(f"✅ Loaded {len(data_points)} data points from CSV")
-        return data_points
+
+        # Keep the data as columns; rows are only materialized for the JSON response
+        data_points = {col: df[col].to_numpy() for col in ['timestamp'] + PRICE_COLUMNS}
+
+        _ttl_cache_put(_market_data_cache, cache_key, data_points, MARKET_DATA_CACHE_TTL_SECONDS)
+
+        print(f"✅ Loaded {len(data_points['timestamp'])} data points from CSV")
+        return dict(data_points)
         
     except FileNotFoundError:
         print(f"❌ CSV file not found at {csv_path}")
@@ -114,6 +192,59 @@ def generate_energy_market_data(days=7, interval_minutes=5):
         print("Falling back to synthetic data generation...")
         return generate_synthetic_data_fallback(days, interval_minutes)
 
+# Precomputed sine table for synthetic data, where exact precision is not needed
+SINE_LUT_SIZE = 4096
+_SINE_LUT = np.sin(np.linspace(0, 2 * np.pi, SINE_LUT_SIZE, endpoint=False))
+_SINE_LUT_SCALE = SINE_LUT_SIZE / (2 * np.pi)
+
+@njit(fastmath=True, cache=True)
+def _lut_sin(phase):
+    """Approximate sin via nearest-entry lookup in the precomputed sine table"""
+    return _SINE_LUT[int(phase * _SINE_LUT_SCALE) & (SINE_LUT_SIZE - 1)]
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _synth_core(hours, days_elapsed, t, intervals_per_day, noise_e, noise_h, noise_t,
+                spike_mask, jump_mask, spike_mag_e, spike_mag_h, jump_mag_t):
+    """Sum the periodic, trend, noise and spike terms for all three synthetic price series"""
+    n = hours.shape[0]
+    energy_prices = np.empty_like(noise_e)
+    hash_prices = np.empty_like(noise_h)
+    token_prices = np.empty_like(noise_t)
+    two_pi = 2 * np.pi
+    for i in prange(n):
+        h = hours[i]
+        d = days_elapsed[i]
+        ti = t[i]
+        
+        # Energy price: 3-day base cycle, large daily swing, 6-hour cycles, rapid oscillations, upward trend
+        energy_prices[i] = (
+            2.5 + 0.5 * _lut_sin(two_pi * d / 3)
+            + 0.8 * _lut_sin(two_pi * (h - 6) / 24)
+            + 0.3 * _lut_sin(two_pi * h / 6)
+            + 0.2 * _lut_sin(two_pi * ti / (intervals_per_day * 0.25))
+            + 0.1 * d
+            + noise_e[i] + spike_mask[i] * spike_mag_e[i]
+        )
+        
+        # Hash price: counter-oscillating with a different phase and peak time
+        hash_prices[i] = (
+            3.0 + 0.7 * _lut_sin(two_pi * d / 2.5 + np.pi / 3)
+            + 1.0 * _lut_sin(two_pi * ti / (intervals_per_day * 0.4))
+            + 0.6 * _lut_sin(two_pi * (h - 10) / 24)
+            + 0.4 * _lut_sin(two_pi * ti / (intervals_per_day * 0.15) + np.pi / 4)
+            + noise_h[i] + spike_mask[i] * spike_mag_h[i]
+        )
+        
+        # Token price: chaotic pattern, inverse daily cycle, complex trend and random jumps
+        token_prices[i] = (
+            2.0 + 1.2 * _lut_sin(two_pi * d / 1.5 + np.pi / 2)
+            + 0.5 * _lut_sin(two_pi * ti / (intervals_per_day * 0.3)) * _lut_sin(two_pi * ti / (intervals_per_day * 0.7))
+            - 0.7 * _lut_sin(two_pi * (h - 6) / 24)
+            - 0.05 * d + 0.3 * _lut_sin(two_pi * d)
+            + noise_t[i] + jump_mask[i] * jump_mag_t[i]
+        )
+    return energy_prices, hash_prices, token_prices
+
 def generate_synthetic_data_fallback(days=7, interval_minutes=5):
     """Fallback synthetic data generation if CSV is not available"""
     
@@ -127,116 +258,123 @@ def generate_synthetic_data_fallback(days=7, interval_minutes=5):
     dates = pd.date_range(start=start_date, end=end_date, freq=f'{interval_minutes}min')[:total_intervals]
     
     # Generate volatile prices with dramatic patterns
-    np.random.seed(42)
-    
-    # Time array for calculations
-    t = np.arange(len(dates))
-    hours = dates.to_series().dt.hour + dates.to_series().dt.minute / 60
-    days_elapsed = t / intervals_per_day
-    
-    # Base price much higher with more variation
-    base_price = 2.5 + 0.5 * np.sin(2 * np.pi * days_elapsed / 3)  # 3-day cycle
-    
-    # Energy price: highly volatile with multiple frequencies
-    energy_daily = 0.8 * np.sin(2 * np.pi * (hours - 6) / 24)  # Much larger daily swing
-    energy_hourly = 0.3 * np.sin(2 * np.pi * hours / 6)  # 6-hour cycles
-    energy_rapid = 0.2 * np.sin(2 * np.pi * t / (intervals_per_day * 0.25))  # Rapid oscillations
-    energy_trend = 0.1 * days_elapsed  # Strong upward trend
-    energy_volatility = np.random.normal(0, 0.15, len(dates))  # High volatility
-    
-    # Add occasional spikes
-    spike_mask = np.random.random(len(dates)) < 0.02  # 2% chance of spike
-    energy_spikes = spike_mask * np.random.uniform(0.5, 2.0, len(dates))
-    
-    energy_prices = base_price + energy_daily + energy_hourly + energy_rapid + energy_trend + energy_volatility + energy_spikes
-    
-    # Hash price: counter-oscillating with different patterns
-    hash_base = 3.0 + 0.7 * np.sin(2 * np.pi * days_elapsed / 2.5 + np.pi/3)  # Different phase
-    hash_oscillation = 1.0 * np.sin(2 * np.pi * t / (intervals_per_day * 0.4))  # Large swings
-    hash_daily = 0.6 * np.sin(2 * np.pi * (hours - 10) / 24)  # Different peak time
-    hash_rapid = 0.4 * np.sin(2 * np.pi * t / (intervals_per_day * 0.15) + np.pi/4)
-    hash_volatility = np.random.normal(0, 0.2, len(dates))  # Even higher volatility
-    hash_spikes = spike_mask * np.random.uniform(-1.0, 3.0, len(dates))
-    
-    hash_prices = hash_base + hash_oscillation + hash_daily + hash_rapid + hash_volatility + hash_spikes
-    
-    # Token price: chaotic pattern with extreme volatility
-    token_base = 2.0 + 1.2 * np.sin(2 * np.pi * days_elapsed / 1.5 + np.pi/2)
-    token_chaos = 0.5 * np.sin(2 * np.pi * t / (intervals_per_day * 0.3)) * np.sin(2 * np.pi * t / (intervals_per_day * 0.7))
-    token_daily = -0.7 * np.sin(2 * np.pi * (hours - 6) / 24)  # Inverse of energy
-    token_trend = -0.05 * days_elapsed + 0.3 * np.sin(2 * np.pi * days_elapsed)  # Complex trend
-    token_volatility = np.random.normal(0, 0.25, len(dates))  # Extreme volatility
-    token_jumps = (np.random.random(len(dates)) < 0.03) * np.random.uniform(-2.0, 4.0, len(dates))  # Random jumps
-    
-    token_prices = token_base + token_chaos + token_daily + token_trend + token_volatility + token_jumps
-    
-    # Convert to numpy arrays to avoid pandas indexing warnings
-    energy_prices = np.array(energy_prices)
-    hash_prices = np.array(hash_prices)
-    token_prices = np.array(token_prices)
+    rng = np.random.default_rng(42)
+    
+    # Draw all Gaussian noise and spike/jump terms in batched calls
+    n = len(dates)
+    # (float32 throughout: synthetic prices don't need double precision)
+    energy_volatility, hash_volatility, token_volatility = (
+        rng.standard_normal((3, n), dtype=np.float32) * np.array([[0.15], [0.20], [0.25]], dtype=np.float32)
+    )
+    spike_mask, jump_mask = rng.random((2, n), dtype=np.float32) < np.array([[0.02], [0.03]], dtype=np.float32)  # 2% spike / 3% jump chance
+    energy_spike_mag, hash_spike_mag, token_jump_mag = rng.uniform(
+        low=[[0.5], [-1.0], [-2.0]], high=[[2.0], [3.0], [4.0]], size=(3, n)
+    ).astype(np.float32)
+    
+    # Time arrays for calculations
+    t = np.arange(n, dtype=np.float32)
+    hours = (dates.hour + dates.minute / 60).to_numpy(dtype=np.float32)
+    days_elapsed = t / np.float32(intervals_per_day)
+    
+    energy_prices, hash_prices, token_prices = _synth_core(
+        hours, days_elapsed, t, float(intervals_per_day),
+        energy_volatility, hash_volatility, token_volatility,
+        spike_mask, jump_mask, energy_spike_mag, hash_spike_mag, token_jump_mag
+    )
     
     # Add market events that affect all prices
     event_times = [0.15, 0.35, 0.55, 0.75, 0.9]
+    decay = np.exp(-np.arange(20, dtype=np.float32) / 5)
     for et in event_times:
         event_idx = int(et * len(dates))
         if event_idx < len(dates) - 20:
-            # Market shock events
-            shock_magnitude = np.random.uniform(-1.5, 1.5)
-            for i in range(20):
-                if event_idx + i < len(dates):
-                    decay = np.exp(-i / 5)
-                    energy_prices[event_idx + i] += shock_magnitude * decay * (1 + 0.3 * np.random.randn())
-                    hash_prices[event_idx + i] += shock_magnitude * decay * 1.5 * (1 + 0.3 * np.random.randn())
-                    token_prices[event_idx + i] += -shock_magnitude * decay * 0.8 * (1 + 0.3 * np.random.randn())
-    
-    # Ensure prices don't go negative but can go very high
-    energy_prices = np.maximum(energy_prices, 0.1)
-    hash_prices = np.maximum(hash_prices, 0.1)
-    token_prices = np.maximum(token_prices, 0.1)
-    
-    # Create list of data points
-    data_points = []
-    
-    for i in range(len(dates)):
-        data_points.append({
-            'timestamp': dates[i].strftime('%Y-%m-%dT%H:%M:%S'),
-            'energy_price': float(energy_prices[i]),
-            'hash_price': float(hash_prices[i]),
-            'token_price': float(token_prices[i])
-        })
-    
-    return data_points
-
-@app.post("/api/timegpt/forecast", response_model=ForecastResponse)
+            # Market shock events, applied to the whole 20-step window at once
+            shock_magnitude = rng.uniform(-1.5, 1.5)
+            idxs = np.arange(event_idx, min(event_idx + 20, len(dates)))
+            shock = shock_magnitude * decay[:len(idxs)]
+            shock_noise = 1 + 0.3 * rng.standard_normal((3, len(idxs)), dtype=np.float32)
+            energy_prices[idxs] += shock * shock_noise[0]
+            hash_prices[idxs] += shock * 1.5 * shock_noise[1]
+            token_prices[idxs] += -shock * 0.8 * shock_noise[2]
+    
+    # Ensure prices don't go negative but can go very high; most series never
+    # dip that low, so only clamp (in place) the ones that do
+    for prices in (energy_prices, hash_prices, token_prices):
+        if prices.min() < 0.1:
+            np.maximum(prices, 0.1, out=prices)
+    
+    # Same columnar layout as generate_energy_market_data
+    return {
+        'timestamp': dates.floor('s').to_numpy(),
+        'energy_price': energy_prices,
+        'hash_price': hash_prices,
+        'token_price': token_prices
+    }
+
+def split_series_frames(master):
+    """Split a market data frame into per-series TimeGPT frames (ds, y, unique_id)"""
+    return tuple(
+        master[['timestamp', col]].rename(columns={'timestamp': 'ds', col: 'y'}).assign(unique_id=col)
+        for col in PRICE_COLUMNS
+    )
+
+def format_timestamps(timestamps):
+    """ISO-format a DatetimeIndex in one vectorized call (tz-aware values keep their offset)"""
+    if timestamps.tz is None:
+        return timestamps.strftime('%Y-%m-%dT%H:%M:%S').tolist()
+    return [timestamp.isoformat() for timestamp in timestamps]
+
+@functools.lru_cache(maxsize=32)
+def interval_keys(confidence_levels):
+    """Response keys for a tuple of confidence levels as (key, series, side, level), in output order"""
+    return tuple(
+        (f'{name}_{side}_{level}', name, side, level)
+        for level in confidence_levels
+        for name in PRICE_COLUMNS
+        for side in ('lo', 'hi')
+    )
+
+@functools.lru_cache(maxsize=32)
+def forecast_row_keys(confidence_levels):
+    """Full key tuple of a forecast response row, so rows can be built with dict(zip(...))"""
+    return ('timestamp', *PRICE_COLUMNS, 'is_historical') + tuple(key for key, _, _, _ in interval_keys(confidence_levels))
+
+def resolve_interval_column(columns, side, level):
+    """Find the TimeGPT confidence-interval column for a side ('lo'/'hi') and level, if present"""
+    # Try different column name formats
+    for col_name in (f'TimeGPT-{side}-{level}', f'TimeGPT-{side}-{float(level)}', f'{side}-{level}'):
+        if col_name in columns:
+            return col_name
+    return None
+
+@app.post("/api/timegpt/forecast", response_model=ForecastResponse, response_class=ORJSONResponse)
 async def generate_forecast(request: ForecastRequest):
     """
     Generate TimeGPT forecast based on historical market data.
     """
     try:
+        # Reuse a recent TimeGPT result for identical parameters instead of paying for another call
+        try:
+            csv_mtime = os.path.getmtime(MARKET_DATA_CSV_PATH)
+        except OSError:
+            csv_mtime = None
+        interval_bucket = int(time.time() // (request.interval_minutes * 60))
+        forecast_cache_key = (csv_mtime, interval_bucket, request.horizon, request.interval_minutes, tuple(request.confidence_levels))
+        cached_payload = _ttl_cache_get(_forecast_cache, forecast_cache_key, FORECAST_CACHE_TTL_SECONDS)
+        if nixtla_client and cached_payload:
+            print("✅ Returning cached TimeGPT forecast")
+            return ORJSONResponse(cached_payload)
+        
         # Generate 7 days of historical data instead of fetching from API
         print("📊 Generating 7 days of historical data...")
         historical_data = generate_energy_market_data(days=7, interval_minutes=request.interval_minutes)
-        print(f"✅ Generated {len(historical_data)} historical data points")
+        print(f"✅ Generated {len(historical_data['timestamp'])} historical data points")
         
-        # Convert to DataFrames for each price type
-        energy_data = []
-        hash_data = []
-        token_data = []
-        
-        for point in historical_data:
-            timestamp = point['timestamp']
-            energy_data.append({'ds': timestamp, 'y': point['energy_price']})
-            hash_data.append({'ds': timestamp, 'y': point['hash_price']})
-            token_data.append({'ds': timestamp, 'y': point['token_price']})
-        
-        energy_df = pd.DataFrame(energy_data)
-        hash_df = pd.DataFrame(hash_data)
-        token_df = pd.DataFrame(token_data)
-        
-        # Ensure we have unique timestamps
-        energy_df = energy_df.drop_duplicates(subset=['ds'], keep='last')
-        hash_df = hash_df.drop_duplicates(subset=['ds'], keep='last')
-        token_df = token_df.drop_duplicates(subset=['ds'], keep='last')
+        # Convert to one master DataFrame, ensuring we have unique timestamps,
+        # then derive the per-series frames by column selection
+        master = pd.DataFrame(historical_data)
+        master = master.drop_duplicates(subset=['timestamp'], keep='last')
+        energy_df, hash_df, token_df = split_series_frames(master)
         print(f"📈 Using {len(energy_df)} unique data points for forecast")
         
         # Check if we have enough data for TimeGPT
@@ -246,65 +384,40 @@ async def generate_forecast(request: ForecastRequest):
             additional_days = max(1, (100 - len(energy_df)) // ((24 * 60) // request.interval_minutes))
             additional_data = generate_energy_market_data(days=additional_days, interval_minutes=request.interval_minutes)
             
-            # Prepend the additional data
-            for point in additional_data:
-                timestamp = point['timestamp']
-                energy_data.insert(0, {'ds': timestamp, 'y': point['energy_price']})
-                hash_data.insert(0, {'ds': timestamp, 'y': point['hash_price']})
-                token_data.insert(0, {'ds': timestamp, 'y': point['token_price']})
-            
-            energy_df = pd.DataFrame(energy_data)
-            hash_df = pd.DataFrame(hash_data)
-            token_df = pd.DataFrame(token_data)
-            energy_df = energy_df.drop_duplicates(subset=['ds'], keep='last')
-            hash_df = hash_df.drop_duplicates(subset=['ds'], keep='last')
-            token_df = token_df.drop_duplicates(subset=['ds'], keep='last')
+            # Prepend the additional data in a single concat onto the existing master frame
+            master = pd.concat([pd.DataFrame(additional_data), master], ignore_index=True)
+            master = master.drop_duplicates(subset=['timestamp'], keep='last')
+            energy_df, hash_df, token_df = split_series_frames(master)
             print(f"✅ Extended to {len(energy_df)} total data points")
         
         if nixtla_client and len(energy_df) > 0:
             try:
                 print(f"🔮 Generating forecasts for all price types...")
                 
-                # Add unique_id column
-                energy_df['unique_id'] = 'energy_price'
-                hash_df['unique_id'] = 'hash_price'
-                token_df['unique_id'] = 'token_price'
-                
-                # Convert to datetime
-                energy_df['ds'] = pd.to_datetime(energy_df['ds'])
-                hash_df['ds'] = pd.to_datetime(hash_df['ds'])
-                token_df['ds'] = pd.to_datetime(token_df['ds'])
-                
                 # Create frequency string
                 freq = f'{request.interval_minutes}min'
                 
-                # Generate forecasts with TimeGPT
-                energy_forecast = nixtla_client.forecast(
-                    df=energy_df,
+                # Generate forecasts for all three series with a single TimeGPT call,
+                # run in a worker thread so the blocking HTTP round trip doesn't stall the event loop
+                combined = pd.concat([energy_df, hash_df, token_df], ignore_index=True)
+                forecast = await anyio.to_thread.run_sync(functools.partial(
+                    nixtla_client.forecast,
+                    df=combined,
                     h=request.horizon,
                     freq=freq,
                     level=[float(level) for level in request.confidence_levels],
                     time_col='ds',
                     target_col='y'
-                )
+                ))
                 
-                hash_forecast = nixtla_client.forecast(
-                    df=hash_df,
-                    h=request.horizon,
-                    freq=freq,
-                    level=[float(level) for level in request.confidence_levels],
-                    time_col='ds',
-                    target_col='y'
-                )
-                
-                token_forecast = nixtla_client.forecast(
-                    df=token_df,
-                    h=request.horizon,
-                    freq=freq,
-                    level=[float(level) for level in request.confidence_levels],
-                    time_col='ds',
-                    target_col='y'
-                )
+                # Split the long-format result back into per-series views
+                series_forecasts = {
+                    uid: group.reset_index(drop=True)
+                    for uid, group in forecast.groupby('unique_id', sort=False)
+                }
+                energy_forecast = series_forecasts['energy_price']
+                hash_forecast = series_forecasts['hash_price']
+                token_forecast = series_forecasts['token_price']
                 
                 # Prepare forecast data
                 forecasts = []
@@ -313,114 +426,94 @@ async def generate_forecast(request: ForecastRequest):
                 
                 # First, add the last 50 historical data points
                 historical_points = min(50, len(energy_df))
-                for i in range(len(energy_df) - historical_points, len(energy_df)):
-                    hist_point = {
-                        'timestamp': energy_df.iloc[i]['ds'].isoformat(),
-                        'energy_price': float(energy_df.iloc[i]['y']),
-                        'hash_price': float(hash_df.iloc[i]['y']),
-                        'token_price': float(token_df.iloc[i]['y']),
-                        'is_historical': True
-                    }
-                    
-                    # Add empty confidence intervals for historical data
-                    for level in request.confidence_levels:
-                        hist_point[f'energy_price_lo_{level}'] = None
-                        hist_point[f'energy_price_hi_{level}'] = None
-                        hist_point[f'hash_price_lo_{level}'] = None
-                        hist_point[f'hash_price_hi_{level}'] = None
-                        hist_point[f'token_price_lo_{level}'] = None
-                        hist_point[f'token_price_hi_{level}'] = None
-                    
-                    forecasts.append(hist_point)
+                tail = energy_df.tail(historical_points)
+                hist_ts = tail['ds'].dt.strftime('%Y-%m-%dT%H:%M:%S').tolist()
+                hist_energy = tail['y'].to_numpy(dtype=float).tolist()
+                hist_hash = hash_df['y'].tail(historical_points).to_numpy(dtype=float).tolist()
+                hist_token = token_df['y'].tail(historical_points).to_numpy(dtype=float).tolist()
+
+                # Empty confidence intervals for historical data
+                key_sets = interval_keys(tuple(request.confidence_levels))
+                empty_ci = dict.fromkeys(key for key, _, _, _ in key_sets)
+
+                for ts_i, e_i, h_i, t_i in zip(hist_ts, hist_energy, hist_hash, hist_token):
+                    forecasts.append({
+                        'timestamp': ts_i,
+                        'energy_price': e_i,
+                        'hash_price': h_i,
+                        'token_price': t_i,
+                        'is_historical': True,
+                        **empty_ci
+                    })
+
+                # Then add the forecast data - pull every column out as a NumPy
+                # array once so the row loop only does positional indexing
+                forecast_ts = energy_forecast['ds'].dt.strftime('%Y-%m-%dT%H:%M:%S').to_numpy()
+                mean_arrays = {name: fc['TimeGPT'].to_numpy(dtype=float) for name, fc in series_forecasts.items()}
+
+                # Confidence intervals - resolve each (series, side, level) column name once
+                interval_cols = {
+                    key: resolve_interval_column(series_forecasts[name].columns, side, level)
+                    for key, name, side, level in key_sets
+                }
+                print(f"Resolved interval columns: {interval_cols}")
                 
-                # Then add the forecast data
-                for i in range(len(energy_forecast)):
-                    forecast_point = {
-                        'timestamp': energy_forecast.iloc[i]['ds'].isoformat(),  # type: ignore
-                        'energy_price': float(energy_forecast.iloc[i]['TimeGPT']),
-                        'hash_price': float(hash_forecast.iloc[i]['TimeGPT']),
-                        'token_price': float(token_forecast.iloc[i]['TimeGPT']),
-                        'is_historical': False
-                    }
-                    
-                    # Add confidence intervals - check for different possible column names
-                    for level in request.confidence_levels:
-                        # Try different column name formats
-                        lo_col_names = [f'TimeGPT-lo-{level}', f'TimeGPT-lo-{float(level)}', f'lo-{level}']
-                        hi_col_names = [f'TimeGPT-hi-{level}', f'TimeGPT-hi-{float(level)}', f'hi-{level}']
-                        
-                        # Energy price intervals
-                        for col_name in lo_col_names:
-                            if col_name in energy_forecast.columns:
-                                forecast_point[f'energy_price_lo_{level}'] = float(energy_forecast.iloc[i][col_name])
-                                break
-                        else:
-                            forecast_point[f'energy_price_lo_{level}'] = float(energy_forecast.iloc[i]['TimeGPT']) * 0.9
-                            
-                        for col_name in hi_col_names:
-                            if col_name in energy_forecast.columns:
-                                forecast_point[f'energy_price_hi_{level}'] = float(energy_forecast.iloc[i][col_name])
-                                break
-                        else:
-                            forecast_point[f'energy_price_hi_{level}'] = float(energy_forecast.iloc[i]['TimeGPT']) * 1.1
-                            
-                        # Hash price intervals
-                        for col_name in lo_col_names:
-                            if col_name in hash_forecast.columns:
-                                forecast_point[f'hash_price_lo_{level}'] = float(hash_forecast.iloc[i][col_name])
-                                break
-                        else:
-                            forecast_point[f'hash_price_lo_{level}'] = float(hash_forecast.iloc[i]['TimeGPT']) * 0.9
-                            
-                        for col_name in hi_col_names:
-                            if col_name in hash_forecast.columns:
-                                forecast_point[f'hash_price_hi_{level}'] = float(hash_forecast.iloc[i][col_name])
-                                break
-                        else:
-                            forecast_point[f'hash_price_hi_{level}'] = float(hash_forecast.iloc[i]['TimeGPT']) * 1.1
-                            
-                        # Token price intervals
-                        for col_name in lo_col_names:
-                            if col_name in token_forecast.columns:
-                                forecast_point[f'token_price_lo_{level}'] = float(token_forecast.iloc[i][col_name])
-                                break
-                        else:
-                            forecast_point[f'token_price_lo_{level}'] = float(token_forecast.iloc[i]['TimeGPT']) * 0.9
-                            
-                        for col_name in hi_col_names:
-                            if col_name in token_forecast.columns:
-                                forecast_point[f'token_price_hi_{level}'] = float(token_forecast.iloc[i][col_name])
-                                break
-                        else:
-                            forecast_point[f'token_price_hi_{level}'] = float(token_forecast.iloc[i]['TimeGPT']) * 1.1
-                    
-                    forecasts.append(forecast_point)
+                # Missing columns fall back to scaling the mean forecast; the scaled array
+                # doesn't depend on the level, so compute it once per (series, side)
+                fallback_arrays = {}
+                interval_arrays = {}
+                for key, name, side, level in key_sets:
+                    col = interval_cols[key]
+                    if col:
+                        interval_arrays[key] = series_forecasts[name][col].to_numpy(dtype=float)
+                    else:
+                        if (name, side) not in fallback_arrays:
+                            fallback_arrays[(name, side)] = mean_arrays[name] * (0.9 if side == 'lo' else 1.1)
+                        interval_arrays[key] = fallback_arrays[(name, side)]
+
+                energy_mean_arr = mean_arrays['energy_price']
+                hash_mean_arr = mean_arrays['hash_price']
+                token_mean_arr = mean_arrays['token_price']
+                # .tolist() converts each column to Python floats in one C loop
+                row_keys = forecast_row_keys(tuple(request.confidence_levels))
+                interval_lists = [interval_arrays[key].tolist() for key, _, _, _ in key_sets]
+                for ts_i, e_i, h_i, t_i, *bounds in zip(
+                    forecast_ts.tolist(),
+                    energy_mean_arr.tolist(),
+                    hash_mean_arr.tolist(),
+                    token_mean_arr.tolist(),
+                    *interval_lists
+                ):
+                    forecasts.append(dict(zip(row_keys, (ts_i, e_i, h_i, t_i, False, *bounds))))
                 
-                # Calculate statistics
-                energy_mean = energy_forecast['TimeGPT'].mean()
-                energy_std = energy_forecast['TimeGPT'].std()
-                energy_min = energy_forecast['TimeGPT'].min()
-                energy_max = energy_forecast['TimeGPT'].max()
+                # Calculate statistics on the already-extracted contiguous array
+                # (ddof=1 matches the sample std pandas reported before)
+                energy_mean = energy_mean_arr.mean()
+                energy_std = energy_mean_arr.std(ddof=1)
+                energy_min = energy_mean_arr.min()
+                energy_max = energy_mean_arr.max()
                 
                 # Detect arbitrage opportunities
-                arbitrage_opportunities = detect_arbitrage_opportunities(energy_forecast['TimeGPT'].values)
+                arbitrage_opportunities = detect_arbitrage_opportunities(energy_mean_arr)
                 
                 print(f"✅ TimeGPT forecast generated successfully")
                 
-                return ForecastResponse(
-                    forecasts=forecasts,
-                    analysis=f"Energy prices expected to range from ${energy_min:.4f} to ${energy_max:.4f} over the next {request.horizon * request.interval_minutes / 60:.1f} hours. Mean: ${energy_mean:.4f}, Volatility: {energy_std:.4f}",
-                    arbitrage_opportunities=arbitrage_opportunities,
-                    generated_at=datetime.now().isoformat(),
-                    model="timegpt-1",
-                    statistics={
+                payload = {
+                    "forecasts": forecasts,
+                    "analysis": f"Energy prices expected to range from ${energy_min:.4f} to ${energy_max:.4f} over the next {request.horizon * request.interval_minutes / 60:.1f} hours. Mean: ${energy_mean:.4f}, Volatility: {energy_std:.4f}",
+                    "arbitrage_opportunities": arbitrage_opportunities,
+                    "generated_at": datetime.now().isoformat(),
+                    "model": "timegpt-1",
+                    "statistics": {
                         "mean": float(energy_mean),
                         "std": float(energy_std),
                         "min": float(energy_min),
                         "max": float(energy_max)
                     },
-                    interval_minutes=request.interval_minutes
-                )
+                    "interval_minutes": request.interval_minutes
+                }
+                _ttl_cache_put(_forecast_cache, forecast_cache_key, payload, FORECAST_CACHE_TTL_SECONDS)
+                return ORJSONResponse(payload)
                 
             except Exception as e:
                 print(f"TimeGPT error: {e}")
@@ -431,11 +524,11 @@ async def generate_forecast(request: ForecastRequest):
                 df = pd.DataFrame(historical_data)
                 print(f"Synthetic forecast dataframe columns: {df.columns.tolist()}")
                 print(f"Synthetic forecast dataframe shape: {df.shape}")
-                return generate_synthetic_forecast_all_types(df, request.horizon, request.interval_minutes, request.confidence_levels)
+                return generate_synthetic_forecast_all_types(df, request.horizon, request.interval_minutes, request.confidence_levels, request.seed)
         else:
             # Use synthetic forecast
             df = pd.DataFrame(historical_data)
-            return generate_synthetic_forecast_all_types(df, request.horizon, request.interval_minutes, request.confidence_levels)
+            return generate_synthetic_forecast_all_types(df, request.horizon, request.interval_minutes, request.confidence_levels, request.seed)
         
     except Exception as e:
         print(f"TimeGPT error: {str(e)}")
@@ -443,23 +536,22 @@ async def generate_forecast(request: ForecastRequest):
         # Fallback to synthetic forecast if TimeGPT fails
         # First try to get data from MARA API
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get('https://mara-hackathon-api.onrender.com/prices')
-                if response.status_code == 200:
-                    mara_data = response.json()
-                    df = pd.DataFrame(mara_data)
-                    df['timestamp'] = pd.to_datetime(df['timestamp'])
-                    df = df.sort_values('timestamp')
-                    df = df.rename(columns={
-                        'timestamp': 'ds',
-                        'energy_price': 'y'
-                    })
-                else:
-                    # Use request data as fallback
-                    df = pd.DataFrame([
-                        {'ds': pd.to_datetime(p.timestamp), 'y': p.energy_price}
-                        for p in request.market_data
-                    ])
+            response = await http_client.get('https://mara-hackathon-api.onrender.com/prices')
+            if response.status_code == 200:
+                mara_data = response.json()
+                df = pd.DataFrame(mara_data)
+                df['timestamp'] = pd.to_datetime(df['timestamp'])
+                df = df.sort_values('timestamp')
+                df = df.rename(columns={
+                    'timestamp': 'ds',
+                    'energy_price': 'y'
+                })
+            else:
+                # Use request data as fallback
+                df = pd.DataFrame([
+                    {'ds': pd.to_datetime(p.timestamp), 'y': p.energy_price}
+                    for p in request.market_data
+                ])
         except:
             # Use request data as fallback
             df = pd.DataFrame([
@@ -467,7 +559,7 @@ async def generate_forecast(request: ForecastRequest):
                 for p in request.market_data
             ])
         
-        return generate_synthetic_forecast_all_types(df, request.horizon, request.interval_minutes, request.confidence_levels)
+        return generate_synthetic_forecast_all_types(df, request.horizon, request.interval_minutes, request.confidence_levels, request.seed)
 
 @app.post("/api/timegpt/anomaly-detection")
 async def detect_anomalies(request: ForecastRequest):
@@ -487,11 +579,12 @@ async def detect_anomalies(request: ForecastRequest):
         if nixtla_client:
             try:
                 # Use TimeGPT anomaly detection
-                anomalies_df = nixtla_client.detect_anomalies(
+                anomalies_df = await anyio.to_thread.run_sync(functools.partial(
+                    nixtla_client.detect_anomalies,
                     df=df,
                     time_col='ds',
                     target_col='y'
-                )
+                ))
                 
                 # Convert to response format
                 anomalies = []
@@ -541,7 +634,7 @@ def generate_synthetic_data(hours=168, interval_minutes=5):
     weekly_pattern = 0.01 * (weekdays < 5).astype(float)
     
     # Add noise
-    noise = np.random.normal(0, 0.005, len(dates))
+    noise = _rng.normal(0, 0.005, len(dates))
     
     # Combine patterns
     prices = daily_pattern + weekly_pattern + noise
@@ -577,7 +670,7 @@ def generate_synthetic_forecast(df, horizon, interval_minutes, confidence_levels
     
     # Generate forecast
     trend_component = recent_trend * np.arange(1, horizon + 1) * 0.1
-    noise = np.random.normal(0, 0.005, horizon)
+    noise = _rng.normal(0, 0.005, horizon)
     
     forecast_values = daily_pattern + trend_component + noise
     forecast_values = np.maximum(forecast_values, 0.01)
@@ -596,8 +689,35 @@ def generate_synthetic_forecast(df, horizon, interval_minutes, confidence_levels
     
     return forecast_df
 
-def generate_synthetic_forecast_all_types(df, horizon, interval_minutes, confidence_levels):
+@njit('f8[:, ::1](f8[::1], f8[::1], f8[::1], f8[::1], f8[:, ::1], f8[::1])', parallel=True, fastmath=True, cache=True)
+def _build_forecast(last_prices, trends, floors, daily_multiplier, noise, uncertainty):
+    """Fill an (n, 3 + 6 * levels) array of forecast prices followed by their interval bounds"""
+    n = daily_multiplier.shape[0]
+    n_levels = uncertainty.shape[0]
+    out = np.empty((n, 3 + 6 * n_levels))
+    # Rows are independent, so they are split across threads
+    for k in prange(n):
+        # Linear drift and the daily multiplier are shared by all three series
+        drift = k * 0.1
+        multiplier = daily_multiplier[k]
+        for s in range(3):
+            price = max(floors[s], last_prices[s] * multiplier + trends[s] * drift + noise[k, s])
+            out[k, s] = price
+            # Bound columns follow the interval key order: level -> series -> side
+            for l in range(n_levels):
+                col = 3 + (l * 3 + s) * 2
+                out[k, col] = price * (1 - uncertainty[l])
+                out[k, col + 1] = price * (1 + uncertainty[l])
+    return out
+
+def generate_synthetic_forecast_all_types(df, horizon, interval_minutes, confidence_levels, seed=None):
     """Generate synthetic forecast for all price types when TimeGPT is not available"""
+    rng = _rng if seed is None else np.random.default_rng(seed)
+    
+    # An empty frame (e.g. no rows in the requested window) carries no usable columns
+    if df.empty:
+        df = pd.DataFrame()
+    
     # Handle different column naming conventions
     if 'timestamp' in df.columns:
         time_col = 'timestamp'
@@ -647,26 +767,16 @@ def generate_synthetic_forecast_all_types(df, horizon, interval_minutes, confide
     else:
         energy_trend = hash_trend = token_trend = 0
     
-    # Convert forecast to response format
-    forecast_data = []
-    
-    # Add historical data first (if available and has all required columns)
+    # Historical data first (if available and has all required columns), kept as columns
     if all(col in df.columns for col in [time_col, energy_col, hash_col, token_col]):
-        historical_points = min(50, len(df))
-        for _, row in df.tail(historical_points).iterrows():
-            timestamp = row[time_col]
-            if hasattr(timestamp, 'isoformat'):
-                timestamp_str = timestamp.isoformat()  # type: ignore
-            else:
-                timestamp_str = pd.to_datetime(timestamp).strftime('%Y-%m-%dT%H:%M:%S')
-            
-            forecast_data.append({
-                'timestamp': timestamp_str,
-                'energy_price': float(row[energy_col]),
-                'hash_price': float(row[hash_col]),
-                'token_price': float(row[token_col]),
-                'is_historical': True
-            })
+        historical = df.tail(min(50, len(df)))
+        historical_ts = format_timestamps(pd.DatetimeIndex(pd.to_datetime(historical[time_col])))
+        historical_energy = historical[energy_col].to_numpy(dtype=np.float64)
+        historical_hash = historical[hash_col].to_numpy(dtype=np.float64)
+        historical_token = historical[token_col].to_numpy(dtype=np.float64)
+    else:
+        historical_ts = []
+        historical_energy = historical_hash = historical_token = np.empty(0)
     
     # Generate forecast dates
     forecast_dates = pd.date_range(
@@ -675,85 +785,154 @@ def generate_synthetic_forecast_all_types(df, horizon, interval_minutes, confide
         freq=f'{interval_minutes}min'
     )
     
-    # Generate forecast for each timestamp
-    for i, timestamp in enumerate(forecast_dates):
-        # Daily pattern
-        hour_of_day = timestamp.hour + timestamp.minute / 60
-        daily_multiplier = 1 + 0.15 * np.sin(2 * np.pi * (hour_of_day - 6) / 24)
-        
-        # Add some randomness
-        energy_noise = (np.random.random() - 0.5) * 0.01
-        hash_noise = (np.random.random() - 0.5) * 0.1
-        token_noise = (np.random.random() - 0.5) * 0.05
-        
-        # Calculate forecast values
-        energy_forecast = max(0.01, last_energy * daily_multiplier + energy_trend * i * 0.1 + energy_noise)
-        hash_forecast = max(0.1, last_hash * daily_multiplier + hash_trend * i * 0.1 + hash_noise)
-        token_forecast = max(0.01, last_token * daily_multiplier + token_trend * i * 0.1 + token_noise)
-        
-        forecast_point = {
-            'timestamp': timestamp.isoformat(),
-            'energy_price': float(energy_forecast),
-            'hash_price': float(hash_forecast),
-            'token_price': float(token_forecast),
-            'is_historical': False
-        }
-        
-        # Add confidence intervals
-        for level in confidence_levels:
-            uncertainty = (100 - level) / 100 * 0.5
-            forecast_point[f'energy_price_lo_{level}'] = float(energy_forecast * (1 - uncertainty))
-            forecast_point[f'energy_price_hi_{level}'] = float(energy_forecast * (1 + uncertainty))
-            forecast_point[f'hash_price_lo_{level}'] = float(hash_forecast * (1 - uncertainty))
-            forecast_point[f'hash_price_hi_{level}'] = float(hash_forecast * (1 + uncertainty))
-            forecast_point[f'token_price_lo_{level}'] = float(token_forecast * (1 - uncertainty))
-            forecast_point[f'token_price_hi_{level}'] = float(token_forecast * (1 + uncertainty))
-        
-        forecast_data.append(forecast_point)
-    
-    # Calculate statistics
-    forecast_only = [f for f in forecast_data if not f.get('is_historical', False)]
-    energy_values = [f['energy_price'] for f in forecast_only]
-    hash_values = [f['hash_price'] for f in forecast_only]
-    token_values = [f['token_price'] for f in forecast_only]
+    # Compute all timesteps at once
+    n = len(forecast_dates)
+    i = np.arange(n)
+    
+    # Daily pattern
+    hour_of_day = (forecast_dates.hour + forecast_dates.minute / 60).to_numpy()
+    daily_multiplier = 1 + 0.15 * np.sin(2 * np.pi * (hour_of_day - 6) / 24)
+    
+    # Add some randomness, drawn for all series in one batch
+    noise = (rng.random((n, 3)) - 0.5) * np.array([0.01, 0.1, 0.05])
+    
+    # Forecast values and every confidence bound in one compiled pass
+    uncertainty = (100 - np.asarray(confidence_levels, dtype=np.float64)) / 100 * 0.5
+    out = _build_forecast(
+        np.array([last_energy, last_hash, last_token], dtype=np.float64),
+        np.array([energy_trend, hash_trend, token_trend], dtype=np.float64),
+        np.array([0.01, 0.1, 0.01]),
+        daily_multiplier,
+        noise,
+        uncertainty
+    )
+    energy_forecast = out[:, 0]
+    hash_forecast = out[:, 1]
+    token_forecast = out[:, 2]
+    
+    # Historical + forecast rows as parallel columns (structure of arrays)
+    timestamps = historical_ts + format_timestamps(forecast_dates)
+    energy_price = np.concatenate([historical_energy, energy_forecast])
+    hash_price = np.concatenate([historical_hash, hash_forecast])
+    token_price = np.concatenate([historical_token, token_forecast])
+    # Historical rows always come first, so one index splits the columns
+    n_historical = len(historical_ts)
+    
+    # Calculate statistics directly on the forecast columns
+    energy_values = energy_price[n_historical:]
+    hash_values = hash_price[n_historical:]
+    token_values = token_price[n_historical:]
     
     # Detect arbitrage opportunities
     opportunities = detect_arbitrage_opportunities(energy_values)
     
+    energy_min, energy_max, energy_mean, energy_std = _summary_stats(energy_values)
     stats = {
-        'mean': float(np.mean(energy_values)),
-        'std': float(np.std(energy_values)),
-        'min': float(np.min(energy_values)),
-        'max': float(np.max(energy_values)),
+        'mean': float(energy_mean),
+        'std': float(energy_std),
+        'min': float(energy_min),
+        'max': float(energy_max),
         'trend': float(energy_trend),
-        'hash_mean': float(np.mean(hash_values)),
-        'token_mean': float(np.mean(token_values))
+        'hash_mean': float(hash_values.mean()),
+        'token_mean': float(token_values.mean())
     }
     
-    return ForecastResponse(
-        forecasts=forecast_data,
-        analysis=f"Synthetic forecast with {len(forecast_only)} future points for all price types. Detected {opportunities} arbitrage opportunities.",
-        arbitrage_opportunities=opportunities,
-        generated_at=datetime.now().isoformat(),
-        model="synthetic",
-        statistics=stats,
-        interval_minutes=interval_minutes
-    )
+    # Convert to response rows only at the serialization boundary
+    # (.tolist() converts whole columns to Python floats in one C loop)
+    row_keys = forecast_row_keys(tuple(confidence_levels))
+    forecast_data = [
+        dict(zip(row_keys, (ts_i, e_i, h_i, t_i, idx < n_historical)))
+        for idx, (ts_i, e_i, h_i, t_i) in enumerate(zip(
+            timestamps, energy_price.tolist(), hash_price.tolist(), token_price.tolist()
+        ))
+    ]
+    
+    # Interval bounds only exist for the forecast rows and are already in key order
+    key_names = [key for key, _, _, _ in interval_keys(tuple(confidence_levels))]
+    for point, bounds in zip(forecast_data[n_historical:], out[:, 3:].tolist()):
+        point.update(zip(key_names, bounds))
+    
+    return ORJSONResponse({
+        "forecasts": forecast_data,
+        "analysis": f"Synthetic forecast with {len(energy_values)} future points for all price types. Detected {opportunities} arbitrage opportunities.",
+        "arbitrage_opportunities": opportunities,
+        "generated_at": datetime.now().isoformat(),
+        "model": "synthetic",
+        "statistics": stats,
+        "interval_minutes": interval_minutes
+    })
+
+@njit('i8(f8[::1])', cache=True)
+def _count_price_outliers(arr):
+    """Count values more than 1.5 standard deviations from the mean (one pass for mean/std, one for counts)"""
+    n = arr.shape[0]
+    s = 0.0
+    s2 = 0.0
+    for x in arr:
+        s += x
+        s2 += x * x
+    mean = s / n
+    std = math.sqrt(max(s2 / n - mean * mean, 0.0))
+    if std < 1e-12:
+        return 0
+    hi = mean + 1.5 * std
+    lo = mean - 1.5 * std
+    count = 0
+    for x in arr:
+        count += (x > hi) + (x < lo)
+    return count
+
+@njit('UniTuple(f8, 4)(f8[::1])', cache=True)
+def _summary_stats(arr):
+    """Return (min, max, mean, std) of a non-empty array in a single pass"""
+    n = arr.shape[0]
+    lo = arr[0]
+    hi = arr[0]
+    s = 0.0
+    s2 = 0.0
+    for x in arr:
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+        s += x
+        s2 += x * x
+    mean = s / n
+    return lo, hi, mean, math.sqrt(max(s2 / n - mean * mean, 0.0))
 
 def detect_arbitrage_opportunities(forecast_values):
     """Detect potential arbitrage opportunities in forecast"""
     if len(forecast_values) < 2:
         return 0
     
-    # Look for significant price variations
-    mean_price = np.mean(forecast_values)
-    std_price = np.std(forecast_values)
-    
     # Count periods with prices significantly above or below mean
-    high_prices = sum(1 for p in forecast_values if p > mean_price + 1.5 * std_price)
-    low_prices = sum(1 for p in forecast_values if p < mean_price - 1.5 * std_price)
+    arr = np.ascontiguousarray(forecast_values, dtype=np.float64)
+    
+    # A flat series has no outliers; one min/max pass is cheaper than mean/std
+    if np.ptp(arr) < 1e-9:
+        return 0
     
-    return high_prices + low_prices
+    if NUMBA_AVAILABLE:
+        return int(_count_price_outliers(arr))
+    
+    # Without numba the interpreted kernel is slow; use vectorized compares instead
+    mean_price = arr.mean()
+    std_price = arr.std()
+    if std_price < 1e-12:
+        return 0
+    hi = mean_price + 1.5 * std_price
+    lo = mean_price - 1.5 * std_price
+    return int(np.count_nonzero(arr > hi) + np.count_nonzero(arr < lo))
+
+def warm_up_kernels():
+    """Compile the numba kernels (or load them from the on-disk cache) before serving requests"""
+    start = time.perf_counter()
+    sample = np.linspace(1.0, 2.0, 8)
+    _summary_stats(sample)
+    _count_price_outliers(sample)
+    generate_synthetic_data_fallback(days=1)
+    generate_synthetic_forecast_all_types(pd.DataFrame(), 2, 5, [80])
+    print(f"⚡ Numba kernels ready in {time.perf_counter() - start:.2f}s")
 
 if __name__ == "__main__":
     import uvicorn